@@ -1,3 +1,6 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser, BaseUserManager, PermissionsMixin
 from django.db import models
 
@@ -18,6 +21,31 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault('is_superuser', True)
 
         return self.create_user(email, first_name, last_name, password, **extra_fields)
+
+    def bulk_create_users(self, users, batch_size=500, max_workers=None):
+        """
+        Cria vários usuários de uma vez a partir de dicionários com email, first_name,
+        last_name, password e campos extras. As senhas são geradas em paralelo (os hashers
+        PBKDF2 e Argon2 liberam o GIL) e os usuários são inseridos com bulk_create.
+        'max_workers' limita as threads de hash; o padrão é CPUs // 8 (entre 1 e 32),
+        já que cada hash Argon2 usa 8 threads próprias e aloca sua própria memória.
+        """
+        users = [dict(user) for user in users]
+        if any(not user.get('email') for user in users):
+            raise ValueError('O email é obrigatório')
+
+        emails = [self.normalize_email(user.pop('email')) for user in users]
+        passwords = [user.pop('password', None) for user in users]
+        if max_workers is None:
+            max_workers = min(32, max(1, (os.cpu_count() or 1) // 8))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashes = list(executor.map(make_password, passwords))
+
+        objs = [
+            self.model(email=email, password=password_hash, **user)
+            for email, password_hash, user in zip(emails, hashes, users)
+        ]
+        return self.bulk_create(objs, batch_size=batch_size)
     
 class User(AbstractUser, PermissionsMixin):
     username = None
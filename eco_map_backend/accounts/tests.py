@@ -1,3 +1,23 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import User
+
+
+class BulkCreateUsersTests(TestCase):
+    def test_normalizes_email_and_hashes_passwords(self):
+        User.objects.bulk_create_users([
+            {'email': 'Ana@EMAIL.COM', 'first_name': 'Ana', 'last_name': 'Silva', 'password': 'teste123#'},
+            {'email': 'bia@EMAIL.COM', 'first_name': 'Bia', 'last_name': 'Souza'},
+        ])
+
+        ana = User.objects.get(email='Ana@email.com')
+        self.assertTrue(ana.has_usable_password())
+        self.assertTrue(ana.check_password('teste123#'))
+
+        bia = User.objects.get(email='bia@email.com')
+        self.assertFalse(bia.has_usable_password())
+
+    def test_requires_email(self):
+        with self.assertRaises(ValueError):
+            User.objects.bulk_create_users([{'first_name': 'Ana', 'last_name': 'Silva'}])
+        self.assertFalse(User.objects.exists())
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-14 13:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eco_points', '0010_collectionpoint_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='collectionpoint',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['is_active', 'status'], name='cp_active_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='collectionpoint',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-id'], name='cp_active_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-14 13:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eco_points', '0011_collectionpoint_cp_active_status_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collectiontype',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-14 13:25
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('eco_points', '0012_collectiontype_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collectionpoint',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -1,9 +1,11 @@
 from django.db import models
+from django.db.models import Q
 from accounts.models import User
 
 class CollectionType(models.Model):
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField(blank=True, max_length=500)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -16,6 +18,7 @@ class CollectionPoint(models.Model):
     types = models.ManyToManyField(CollectionType, related_name='points')
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     user = models.ForeignKey(User, on_delete=models.SET_NULL, related_name='collection_points', null=True, blank=True)
     status = models.CharField(max_length=20, default='pending', choices=[
         ('pending', 'Pending'),
@@ -23,6 +26,13 @@ class CollectionPoint(models.Model):
         ('approved', 'Approved'),
     ])
 
+    class Meta:
+        indexes = [
+            # Índices parciais para as listagens de pontos inativos (admin) e ativos (app)
+            models.Index(fields=['is_active', 'status'], name='cp_active_status_idx', condition=Q(is_active=False)),
+            models.Index(fields=['-id'], name='cp_active_idx', condition=Q(is_active=True)),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -0,0 +1,10 @@
+from rest_framework.pagination import CursorPagination
+
+class PointCursorPagination(CursorPagination):
+    """
+    Paginação por cursor ordenada pelo id (mais recentes primeiro).
+    Evita o COUNT(*) da paginação por número de página e usa a chave
+    primária para buscar cada página com LIMIT.
+    """
+    page_size = 50
+    ordering = '-id'
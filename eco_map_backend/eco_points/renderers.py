@@ -0,0 +1,29 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderiza JSON com orjson, gerando os bytes diretamente em C.
+    Usa o JSONRenderer padrão quando o orjson não está instalado ou
+    quando a resposta pede indentação (ex: API navegável).
+    """
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Datas e horários passam pelo JSONEncoder do DRF (ex: sufixo 'Z', milissegundos)
+        ret = orjson.dumps(data, default=self._encoder.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+
+        # Mesmo escape do JSONRenderer para manter a saída um subconjunto estrito de javascript
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -1,8 +1,87 @@
 from .models import CollectionPoint, CollectionType, PointReview, OperatingHour, PointImage
 from .validators import validate_latitude_value, validate_longitude_value, validate_category_value
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from collections import defaultdict
 
-class OperatingHourSerializer(serializers.ModelSerializer):
+_fast_representation_factories = {}
+
+def _build_representation_factory(layout):
+    """
+    Gera o código de uma fábrica de to_representation para o layout de campos informado.
+    Cada item do layout é (nome do campo, atributo do modelo ou None para usar get_attribute).
+    """
+    lines = ['def factory(fields):']
+    if layout:
+        lines.append('    ' + ', '.join(f'f{i}' for i in range(len(layout))) + ', = fields')
+    for i, (_, attr) in enumerate(layout):
+        lines.append(f'    r{i} = f{i}.to_representation')
+        if attr is None:
+            lines.append(f'    g{i} = f{i}.get_attribute')
+
+    lines += ['    def to_representation(instance):', '        ret = {}']
+    for i, (name, attr) in enumerate(layout):
+        if attr is not None:
+            lines += [
+                f'        value = instance.{attr}',
+                f'        ret[{name!r}] = None if value is None else r{i}(value)',
+            ]
+        else:
+            lines += [
+                '        try:',
+                f'            value = g{i}(instance)',
+                '        except SkipField:',
+                '            pass',
+                '        else:',
+                '            check = value.pk if isinstance(value, PKOnlyObject) else value',
+                f'            ret[{name!r}] = None if check is None else r{i}(value)',
+            ]
+    lines += ['        return ret', '    return to_representation']
+
+    namespace = {'SkipField': SkipField, 'PKOnlyObject': PKOnlyObject}
+    exec(compile('\n'.join(lines), f'<fast to_representation {[name for name, _ in layout]}>', 'exec'), namespace)
+    return namespace['factory']
+
+class FastModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer que gera (compile/exec) um to_representation específico para seus campos,
+    eliminando o laço genérico do DRF. Campos simples do modelo são lidos direto do atributo;
+    relações, campos aninhados e sources compostos continuam usando get_attribute.
+    Serializers com SerializerMethodField, ou instâncias que não são do modelo (ex: dicts),
+    usam o caminho padrão do DRF.
+    """
+    def to_representation(self, instance):
+        if not isinstance(instance, self.Meta.model):
+            return super().to_representation(instance)
+
+        fast = self.__dict__.get('_fast_to_representation')
+        if fast is None:
+            fast = self._fast_to_representation = self._build_fast_to_representation()
+        if fast is False:
+            return super().to_representation(instance)
+        return fast(instance)
+
+    def _build_fast_to_representation(self):
+        fields = list(self._readable_fields)
+        if any(isinstance(field, serializers.SerializerMethodField) for field in fields):
+            return False
+
+        model_attrs = {field.name for field in self.Meta.model._meta.concrete_fields if not field.is_relation}
+        layout = []
+        for field in fields:
+            attr = field.source_attrs[0] if len(field.source_attrs) == 1 else None
+            if attr not in model_attrs or type(field).get_attribute is not serializers.Field.get_attribute:
+                attr = None
+            layout.append((field.field_name, attr))
+        layout = tuple(layout)
+
+        factory = _fast_representation_factories.get(layout)
+        if factory is None:
+            factory = _fast_representation_factories[layout] = _build_representation_factory(layout)
+        return factory(fields)
+
+class OperatingHourSerializer(FastModelSerializer):
     class Meta:
         model = OperatingHour
         fields = ['day_of_week', 'opening_time', 'closing_time', 'active']
@@ -23,7 +102,7 @@ class OperatingHourSerializer(serializers.ModelSerializer):
 
         return data
 
-class PointImageSerializer(serializers.ModelSerializer):
+class PointImageSerializer(FastModelSerializer):
     class Meta:
         model = PointImage
         fields = ['id', 'collection_point', 'image']
@@ -45,7 +124,7 @@ class CollectionTypeSerializer(serializers.ModelSerializer):
         model = CollectionType
         fields = ['id', 'name', 'description']
 
-class CollectionPointSerializer(serializers.ModelSerializer):
+class CollectionPointSerializer(FastModelSerializer):
     latitude = serializers.DecimalField(validators=[validate_latitude_value], max_digits=9, decimal_places=6)
     longitude = serializers.DecimalField(validators=[validate_longitude_value], max_digits=9, decimal_places=6)
     types = serializers.PrimaryKeyRelatedField(many=True, queryset=CollectionType.objects.all())
@@ -79,7 +158,76 @@ class CollectionPointSerializer(serializers.ModelSerializer):
 
         return collection_point
 
-class PointReviewSerializer(serializers.ModelSerializer):
+COLLECTION_POINT_LIST_FIELDS = ('id', 'name', 'description', 'latitude', 'longitude', 'is_active', 'created_at', 'user', 'user__first_name', 'status')
+
+_coordinate_field = serializers.DecimalField(max_digits=9, decimal_places=6)
+_datetime_field = serializers.DateTimeField()
+_time_field = serializers.TimeField()
+_image_storage = PointImage._meta.get_field('image').storage
+
+def _serialize_point(row, types_by_pid, hours_by_pid, images_by_pid):
+    point_id = row['id']
+    data = {
+        'id': point_id,
+        'name': row['name'],
+        'description': row['description'],
+        'latitude': _coordinate_field.to_representation(row['latitude']),
+        'longitude': _coordinate_field.to_representation(row['longitude']),
+        'types': types_by_pid[point_id],
+        'is_active': row['is_active'],
+        'created_at': _datetime_field.to_representation(row['created_at']),
+        'operating_hours': hours_by_pid[point_id],
+        'images': images_by_pid[point_id],
+        'user': row['user'],
+    }
+    # Mesmo comportamento do CollectionPointSerializer: sem usuário, 'user_name' é omitido
+    if row['user'] is not None:
+        data['user_name'] = row['user__first_name']
+    data['status'] = row['status']
+    return data
+
+def serialize_collection_point_rows(rows, request=None):
+    """
+    Serializa linhas de pontos de coleta obtidas via .values(*COLLECTION_POINT_LIST_FIELDS)
+    sem passar pelo CollectionPointSerializer, gerando a mesma saída para listagens.
+    Os tipos, horários e imagens são buscados em uma consulta cada.
+    """
+    ids = [row['id'] for row in rows]
+
+    # Linhas relacionadas vêm como tuplas de .values_list(), sem instanciar modelos nem dicts por linha
+    types_by_pid = defaultdict(list)
+    point_types = CollectionPoint.types.through.objects.filter(collectionpoint_id__in=ids)
+    for point_id, type_id in point_types.values_list('collectionpoint_id', 'collectiontype_id'):
+        types_by_pid[point_id].append(type_id)
+
+    time_repr = _time_field.to_representation
+    hours_by_pid = defaultdict(list)
+    hours = OperatingHour.objects.filter(collection_point_id__in=ids)
+    for point_id, day, opening, closing, active in hours.values_list('collection_point_id', 'day_of_week', 'opening_time', 'closing_time', 'active'):
+        hours_by_pid[point_id].append({
+            'day_of_week': day,
+            'opening_time': time_repr(opening),
+            'closing_time': time_repr(closing),
+            'active': active,
+        })
+
+    images_by_pid = defaultdict(list)
+    images = PointImage.objects.filter(collection_point_id__in=ids)
+    for image_id, point_id, name in images.values_list('id', 'collection_point_id', 'image'):
+        url = None
+        if name:
+            url = _image_storage.url(name)
+            if request is not None:
+                url = request.build_absolute_uri(url)
+        images_by_pid[point_id].append({
+            'id': image_id,
+            'collection_point': point_id,
+            'image': url,
+        })
+
+    return [_serialize_point(row, types_by_pid, hours_by_pid, images_by_pid) for row in rows]
+
+class PointReviewSerializer(FastModelSerializer):
     user_name = serializers.CharField(source='user.first_name')
     point_name = serializers.CharField(source='point.name', read_only=True)
 
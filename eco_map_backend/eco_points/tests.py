@@ -1,3 +1,136 @@
-from django.test import TestCase
+import datetime
+import io
+import shutil
+import tempfile
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from .models import CollectionPoint, PointImage, PointReview
+from .renderers import ORJSONRenderer
+from .serializers import OperatingHourSerializer
+
+class ActiveCollectionPointsCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('ana@email.com', 'Ana', 'Silva', 'teste123#')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.point = CollectionPoint.objects.create(name='Ponto', latitude=1, longitude=2, is_active=True, status='approved', user=self.user)
+
+    def active_points(self):
+        response = self.client.get('/api/eco-points/collection-points/active/')
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def active_names(self):
+        return [point['name'] for point in self.active_points()]
+
+    def active_images(self):
+        return [point['images'] for point in self.active_points()]
+
+    def upload(self, content, name):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with override_settings(MEDIA_ROOT=media_root):
+            return self.client.post(
+                f'/api/eco-points/collection-point/{self.point.pk}/upload_image/',
+                {'image': SimpleUploadedFile(name, content)},
+                format='multipart',
+            )
+
+    def test_edit_through_detail_refreshes_active_list(self):
+        self.assertEqual(self.active_names(), ['Ponto'])
+
+        response = self.client.patch(f'/api/eco-points/collection-points/{self.point.pk}/', {'name': 'Renomeado'}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.active_names(), ['Renomeado'])
+
+    def test_delete_refreshes_active_list(self):
+        other = CollectionPoint.objects.create(name='Outro', latitude=1, longitude=2, is_active=True, status='approved', user=self.user)
+        self.assertEqual(self.active_names(), ['Outro', 'Ponto'])
+
+        response = self.client.delete(f'/api/eco-points/collection-points/{self.point.pk}/')
+        self.assertEqual(response.status_code, 204)
+
+        self.assertEqual(self.active_names(), ['Outro'])
+
+    def test_unknown_query_params_bypass_cache(self):
+        with mock.patch('eco_points.views.cache') as view_cache:
+            for i in range(3):
+                response = self.client.get(f'/api/eco-points/collection-points/active/?x={i}')
+                self.assertEqual(response.status_code, 200)
+
+        view_cache.get.assert_not_called()
+        view_cache.set.assert_not_called()
+
+    def test_image_upload_refreshes_active_list(self):
+        self.assertEqual(self.active_images(), [[]])
+
+        buffer = io.BytesIO()
+        Image.new('RGB', (2, 2)).save(buffer, 'PNG')
+        response = self.upload(buffer.getvalue(), 'ponto.png')
+        self.assertEqual(response.status_code, 201)
+
+        self.assertEqual(len(self.active_images()[0]), 1)
+
+    def test_failed_image_upload_keeps_version(self):
+        updated_at = self.point.updated_at
+
+        response = self.upload(b'not an image', 'ponto.png')
+        self.assertEqual(response.status_code, 400)
+
+        self.point.refresh_from_db()
+        self.assertEqual(self.point.updated_at, updated_at)
+        self.assertFalse(PointImage.objects.exists())
+
+
+class PointReviewFilteredListTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('bia@email.com', 'Bia', 'Souza', 'teste123#')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        point = CollectionPoint.objects.create(name='Ponto', latitude=1, longitude=2, user=self.user)
+        other = CollectionPoint.objects.create(name='Outro', latitude=3, longitude=4, user=self.user)
+        self.review = PointReview.objects.create(point=point, user=self.user, comment='Bom')
+        PointReview.objects.create(point=other, user=self.user, comment='Ruim')
+
+    def test_filters_by_point(self):
+        response = self.client.get('/api/eco-points/point-review/filter/', {'point_id': self.review.point_id})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([review['id'] for review in response.json()['results']], [self.review.pk])
+
+    def test_non_numeric_ids_are_rejected(self):
+        for value in ('abc', '²', '٣'):
+            for param in ('user_id', 'point_id'):
+                response = self.client.get('/api/eco-points/point-review/filter/', {param: value})
+                self.assertEqual(response.status_code, 400, (param, value))
+
+
+class FastModelSerializerTests(TestCase):
+    def test_mapping_instance_uses_default_representation(self):
+        data = {'day_of_week': 1, 'opening_time': '08:00', 'closing_time': '17:00', 'active': True}
+        serializer = OperatingHourSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+
+        self.assertEqual(serializer.data, {'day_of_week': 1, 'opening_time': '08:00:00', 'closing_time': '17:00:00', 'active': True})
+
+class ORJSONRendererTests(TestCase):
+    def test_matches_stock_json_renderer(self):
+        data = {
+            'created_at': datetime.datetime(2025, 6, 6, 18, 57, 1, 123456, tzinfo=datetime.timezone.utc),
+            'day': datetime.date(2025, 6, 6),
+            'opening_time': datetime.time(8, 30),
+            'latitude': Decimal('1.500000'),
+            'names': ('a', 'ç'),
+        }
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import CollectionPointDetail, CollectionPointList, CollectionTypeDetail, CollectionTypeList, PointReviewDetail, PointReviewList, PointReviewFilteredList, PointImageUploadView, UserSubmitedCollectionPointsList, ActiveCollectionPointsList, InactiveCollectionPointsList, UpdatePointStatusView
+from .views import CollectionPointDetail, CollectionPointList, CollectionTypeDetail, CollectionTypeList, PointReviewDetail, PointReviewList, PointReviewFilteredList, PointImageUploadView, UserSubmitedCollectionPointsList, ActiveCollectionPointsList, ActiveCollectionPointsStream, InactiveCollectionPointsList, UpdatePointStatusView
 
 urlpatterns = [
     path('collection-points/', CollectionPointList.as_view(), name='collection-points-list'),
@@ -7,6 +7,7 @@ urlpatterns = [
     path('collection-points/<int:pk>/update-status/', UpdatePointStatusView.as_view(), name='collection-point-update-status'),
     path('collection-points/my-submits/', UserSubmitedCollectionPointsList.as_view(), name='user-submited-collection-points'),
     path('collection-points/active/', ActiveCollectionPointsList.as_view(), name='active-collection-points'),
+    path('collection-points/active/stream/', ActiveCollectionPointsStream.as_view(), name='active-collection-points-stream'),
     path('collection-points/inactive/', InactiveCollectionPointsList.as_view(), name='inactive-collection-points'),
 ]
 
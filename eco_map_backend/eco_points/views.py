@@ -1,64 +1,163 @@
+import hashlib
+from itertools import islice
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from rest_framework import generics, status
-from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiParameter
-from django.shortcuts import get_object_or_404
+from rest_framework import generics, serializers, status
+from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiParameter, inline_serializer
+from django.core.cache import cache
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.db import transaction
+from django.db.models import Count, Max, Prefetch
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from rest_framework.parsers import MultiPartParser
+from rest_framework.renderers import BrowsableAPIRenderer
 
 from .models import CollectionType, CollectionPoint, PointReview, OperatingHour, PointImage
-from .serializers import CollectionPointSerializer, CollectionTypeSerializer, PointReviewSerializer, OperatingHourSerializer, PointImageUploadSerializer, PointImageSerializer, PointStatusUpdateSerializer
+from .pagination import PointCursorPagination
+from .renderers import ORJSONRenderer
+from .serializers import COLLECTION_POINT_LIST_FIELDS, serialize_collection_point_rows, CollectionPointSerializer, CollectionTypeSerializer, PointReviewSerializer, OperatingHourSerializer, PointImageUploadSerializer, PointImageSerializer, PointStatusUpdateSerializer
 
-def get_all_object_collection_type():
-    return CollectionType.objects.all()
+COLLECTION_TYPE_BASE_QS = CollectionType.objects.all()
 
-def get_all_object_collection_point():
-    return CollectionPoint.objects.all().prefetch_related('operating_hours', 'images').select_related('user')
+COLLECTION_POINT_BASE_QS = CollectionPoint.objects.select_related('user').prefetch_related(
+    Prefetch('types', queryset=CollectionType.objects.only('id')),
+    Prefetch('operating_hours', queryset=OperatingHour.objects.only('id', 'collection_point_id', 'day_of_week', 'opening_time', 'closing_time', 'active')),
+    Prefetch('images', queryset=PointImage.objects.only('id', 'collection_point_id', 'image')),
+).only('id', 'name', 'description', 'latitude', 'longitude', 'is_active', 'created_at', 'updated_at', 'status', 'user__id', 'user__first_name')
 
-def get_all_object_operating_hour():
-    return OperatingHour.objects.all()
+OPERATING_HOUR_BASE_QS = OperatingHour.objects.all()
 
-def get_all_object_point_review():
-    return PointReview.objects.all().select_related('user', 'point')
+REVIEW_BASE_QS = PointReview.objects.select_related('user', 'point').only('id', 'comment', 'created_at', 'user__id', 'user__first_name', 'point__id', 'point__name')
+
+class CollectionPointFastListMixin:
+    """
+    Lista pontos de coleta serializando diretamente as linhas de .values(),
+    evitando o custo do CollectionPointSerializer por linha. Criação e
+    detalhe continuam usando o serializer para manter as validações.
+    """
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).values(*COLLECTION_POINT_LIST_FIELDS)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serialize_collection_point_rows(page, request))
+
+        return Response(serialize_collection_point_rows(list(queryset), request))
+
+class CachedJSONListMixin:
+    """
+    Guarda em cache o JSON já renderizado da listagem, separado pela versão dos dados
+    informada pela view, formato, host, caminho e página. A chave é um hash, o que a
+    mantém curta para qualquer backend de cache. A API navegável não usa o cache.
+    """
+    cache_prefix = None
+    cache_timeout = 3600
+
+    def cached_list(self, request, version, *args, **kwargs):
+        pagination_params = {
+            getattr(self.paginator, name, None)
+            for name in ('cursor_query_param', 'page_query_param', 'page_size_query_param')
+        }
+        # Só a API JSON e URLs com apenas parâmetros de paginação usam o cache, para que
+        # parâmetros arbitrários não criem novas entradas
+        if request.accepted_renderer.format != 'json' or not set(request.query_params) <= pagination_params:
+            return super().list(request, *args, **kwargs)
+
+        pagination = sorted((param, request.query_params[param]) for param in request.query_params)
+        raw_key = f"{version}:{request.accepted_media_type}:{request.get_host()}{request.path}:{pagination}"
+        cache_key = f"{self.cache_prefix}:{hashlib.md5(raw_key.encode()).hexdigest()}"
+        content = cache.get(cache_key)
+        if content is None:
+            data = super().list(request, *args, **kwargs).data
+            content = request.accepted_renderer.render(data, request.accepted_media_type, self.get_renderer_context())
+            cache.set(cache_key, content, self.cache_timeout)
+
+        return HttpResponse(content, content_type=request.accepted_renderer.media_type)
 
 @extend_schema(tags=["Tipo de coleta"])
-class CollectionTypeList(generics.ListCreateAPIView):
+class CollectionTypeList(CachedJSONListMixin, generics.ListCreateAPIView):
     """
     Responsável por lidar com operações para vários tipos de coleta (getAll)
     """
-    queryset = get_all_object_collection_type()
     serializer_class = CollectionTypeSerializer
     permission_classes = [IsAuthenticated]
+    cache_prefix = 'ctypes'
+
+    def get_queryset(self):
+        """
+        Retorna todos os tipos de coleta.
+        """
+        return COLLECTION_TYPE_BASE_QS.all()
+
+    def list(self, request, *args, **kwargs):
+        """
+        Responde 304 quando o cliente já possui a versão atual dos tipos de coleta e
+        reaproveita o JSON renderizado em cache enquanto a tabela não for alterada.
+        A versão combina o maior 'updated_at' com a quantidade de tipos (cobre remoções).
+        """
+        version = CollectionType.objects.aggregate(updated=Max('updated_at'), total=Count('id'))
+        updated = version['updated']
+        last_modified = int(updated.timestamp()) if updated else None
+        etag = quote_etag(f"{version['total']}-{updated.timestamp() if updated else 0}")
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = self.cached_list(request, etag, *args, **kwargs)
+
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
 
 @extend_schema(tags=["Tipo de coleta"])
 class CollectionTypeDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     Responsável por lidar com operações especificas por tipo de coleta (via id)
     """
-    queryset = get_all_object_collection_type()
     serializer_class = CollectionTypeSerializer
     permission_classes = [IsAuthenticated]
     lookup_field = 'pk'
 
+    def get_queryset(self):
+        """
+        Retorna todos os tipos de coleta.
+        """
+        return COLLECTION_TYPE_BASE_QS.all()
+
 @extend_schema(tags=["Ponto de coleta"])
-class CollectionPointList(generics.ListCreateAPIView):
+class CollectionPointList(CollectionPointFastListMixin, generics.ListCreateAPIView):
     """
     Responsável por lidar com operações para vários pontos de coleta (getAll)
     """
-    queryset = get_all_object_collection_point()
     serializer_class = CollectionPointSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = PointCursorPagination
+
+    def get_queryset(self):
+        """
+        Retorna todos os pontos de coleta com usuário, tipos, horários e imagens pré-carregados.
+        """
+        return COLLECTION_POINT_BASE_QS.all()
     
 @extend_schema(tags=["Ponto de coleta"])
 class CollectionPointDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     Responsável por lidar com operações especificas por ponto de coleta (via id)
     """
-    queryset = get_all_object_collection_point()
     serializer_class = CollectionPointSerializer
     permission_classes = [IsAuthenticated]
     lookup_field = 'pk'
 
+    def get_queryset(self):
+        """
+        Retorna todos os pontos de coleta com usuário, tipos, horários e imagens pré-carregados.
+        """
+        return COLLECTION_POINT_BASE_QS.all()
+
 @extend_schema(tags=["Horário de funcionamento (ponto de coleta)"])
 class OperatingHourList(generics.ListCreateAPIView):
     """
@@ -66,9 +165,16 @@ class OperatingHourList(generics.ListCreateAPIView):
     cria um novo horário de funcionamento.
     Ao criar, 'collection_point_id' deve ser fornecido no corpo da requisição.
     """
-    queryset = get_all_object_operating_hour()
     serializer_class = OperatingHourSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = PointCursorPagination
+
+    def get_queryset(self):
+        """
+        Retorna todos os horários de funcionamento.
+        """
+        return OPERATING_HOUR_BASE_QS.all()
 
 @extend_schema(tags=["Horário de funcionamento (ponto de coleta)"])
 class OperatingHourDetail(generics.ListCreateAPIView):
@@ -87,7 +193,7 @@ class OperatingHourDetail(generics.ListCreateAPIView):
         """
         collection_point_pk = self.kwargs.get('collection_point_pk')
         if collection_point_pk is not None:
-            return OperatingHour.objects.filter(collection_point_id=collection_point_pk)
+            return OPERATING_HOUR_BASE_QS.filter(collection_point_id=collection_point_pk)
         return OperatingHour.objects.none() # Ou levante um erro 404 se o pk não for fornecido e for obrigatório
     
     def perform_create(self, serializer):
@@ -96,28 +202,45 @@ class OperatingHourDetail(generics.ListCreateAPIView):
         especificado no parâmetro 'collection_point_pk' da URL.
         """
         collection_point_pk = self.kwargs.get('collection_point_pk')
-        get_object_or_404(CollectionPoint, pk=collection_point_pk)
-        serializer.save(collection_point_id=collection_point_pk)
+        if not CollectionPoint.objects.filter(pk=collection_point_pk).exists():
+            raise Http404()
+
+        # 'updated_at' do ponto (versão do cache da listagem) só muda junto com o novo horário
+        with transaction.atomic():
+            serializer.save(collection_point_id=collection_point_pk)
+            CollectionPoint.objects.filter(pk=collection_point_pk).update(updated_at=timezone.now())
 
 @extend_schema(tags=["Avaliação do ponto"])
 class PointReviewList(generics.ListCreateAPIView):
     """
     Responsável por lidar com operações especificas por review do ponto (getAll)
     """
-    queryset = get_all_object_point_review()
     serializer_class = PointReviewSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = PointCursorPagination
+
+    def get_queryset(self):
+        """
+        Retorna todas as avaliações com usuário e ponto de coleta pré-carregados.
+        """
+        return REVIEW_BASE_QS.all()
 
 @extend_schema(tags=["Avaliação do ponto"])
 class PointReviewDetail(generics.RetrieveUpdateDestroyAPIView):
     """
     Responsável por lidar com operações especificas por review do ponto (via id)
     """
-    queryset = get_all_object_point_review()
     serializer_class = PointReviewSerializer
     permission_classes = [IsAuthenticated]
     lookup_field = 'pk'
 
+    def get_queryset(self):
+        """
+        Retorna todas as avaliações com usuário e ponto de coleta pré-carregados.
+        """
+        return REVIEW_BASE_QS.all()
+
 @extend_schema(
     tags=["Avaliação do ponto"],
     parameters=[
@@ -125,24 +248,32 @@ class PointReviewDetail(generics.RetrieveUpdateDestroyAPIView):
         OpenApiParameter(name="point_id", required=False, description="ID do ponto de coleta", type=int),
     ]
 )
-class PointReviewFilteredList(APIView):
+class PointReviewFilteredList(generics.GenericAPIView):
     """
     Retorna avaliações filtradas por usuário e/ou ponto de coleta.
     """
+    serializer_class = PointReviewSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = PointCursorPagination
 
     def get(self, request):
-        user_id = request.query_params.get('user_id')
-        point_id = request.query_params.get('id')
-
-        queryset = PointReview.objects.all()
-
-        if user_id:
-            queryset = queryset.filter(user_id=user_id)
-        if point_id:
-            queryset = queryset.filter(collection_point_id=point_id)
-
-        serializer = PointReviewSerializer(queryset, many=True)
+        queryset = REVIEW_BASE_QS.all()
+
+        for param in ('user_id', 'point_id'):
+            value = request.query_params.get(param)
+            if not value:
+                continue
+            # isascii() evita dígitos Unicode ('²', '٣') que isdecimal()/isdigit() aceitam
+            if not (value.isascii() and value.isdecimal()):
+                return Response({"error": f"'{param}' deve ser um número inteiro."}, status=status.HTTP_400_BAD_REQUEST)
+            queryset = queryset.filter(**{param: int(value)})
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 @extend_schema(
@@ -157,35 +288,41 @@ class PointImageUploadView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, pk=None):
-        collection_point = get_object_or_404(CollectionPoint, pk=pk)
+        if not CollectionPoint.objects.filter(pk=pk).exists():
+            raise Http404()
 
         upload_serializer = PointImageUploadSerializer(data=request.data)
         upload_serializer.is_valid(raise_exception=True)
 
         image_file = upload_serializer.validated_data['image']
-        new_image = PointImage.objects.create(
-            collection_point=collection_point,
-            image=image_file
-        )
+        # 'updated_at' do ponto (versão do cache da listagem) só muda junto com a nova imagem
+        with transaction.atomic():
+            new_image = PointImage.objects.create(
+                collection_point_id=pk,
+                image=image_file
+            )
+            CollectionPoint.objects.filter(pk=pk).update(updated_at=timezone.now())
 
         response_serializer = PointImageSerializer(new_image)
 
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
     
 @extend_schema(tags=["Ponto de coleta"])
-class UserSubmitedCollectionPointsList(generics.ListAPIView):
+class UserSubmitedCollectionPointsList(CollectionPointFastListMixin, generics.ListAPIView):
     """
     Lista todos os pontos de coleta submetidos pelo usuário logado.
     """
     serializer_class = CollectionPointSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = PointCursorPagination
 
     def get_queryset(self):
         """
         Retorna uma lista de pontos de coleta submetidos pelo usuário autenticado.
         """
         user = self.request.user
-        return CollectionPoint.objects.filter(user=user).prefetch_related('operating_hours', 'images').select_related('user')
+        return COLLECTION_POINT_BASE_QS.filter(user=user)
 
     def get_serializer_context(self):
         """
@@ -194,18 +331,32 @@ class UserSubmitedCollectionPointsList(generics.ListAPIView):
         return {'request': self.request}
     
 @extend_schema(tags=["Ponto de coleta"])
-class ActiveCollectionPointsList(generics.ListAPIView):
+class ActiveCollectionPointsList(CachedJSONListMixin, CollectionPointFastListMixin, generics.ListAPIView):
     """
     Lista todos os pontos de coleta ativos (is_active=True).
     """
     serializer_class = CollectionPointSerializer
     permission_classes = [IsAuthenticated] 
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = PointCursorPagination
+    cache_prefix = 'acp'
 
     def get_queryset(self):
         """
         Retorna uma lista de todos os pontos de coleta ativos.
         """
-        return CollectionPoint.objects.filter(is_active=True).prefetch_related('operating_hours', 'images').select_related('user')
+        return COLLECTION_POINT_BASE_QS.filter(is_active=True)
+
+    def list(self, request, *args, **kwargs):
+        """
+        Lista os pontos ativos a partir do cache. A versão vem toda do banco: o maior
+        'updated_at' da tabela inteira (para que pontos desativados também mudem a versão)
+        e a quantidade de pontos ativos (cobre remoções). As duas consultas usam índices.
+        """
+        updated = CollectionPoint.objects.aggregate(updated=Max('updated_at'))['updated']
+        active = self.get_queryset().aggregate(total=Count('id'))['total']
+        version = f"{active}-{updated.timestamp() if updated else 0}"
+        return self.cached_list(request, version, *args, **kwargs)
 
     def get_serializer_context(self):
         """
@@ -213,20 +364,57 @@ class ActiveCollectionPointsList(generics.ListAPIView):
         """
         return {'request': self.request}
 
+@extend_schema(tags=["Ponto de coleta"], responses={200: CollectionPointSerializer(many=True)})
+class ActiveCollectionPointsStream(generics.GenericAPIView):
+    """
+    Exporta todos os pontos de coleta ativos, sem paginação, em uma resposta JSON
+    transmitida em partes. Os pontos são lidos do banco em blocos de 'chunk_size'
+    para não montar o resultado inteiro em memória.
+    """
+    serializer_class = CollectionPointSerializer
+    permission_classes = [IsAuthenticated]
+    chunk_size = 500
+
+    def get_queryset(self):
+        """
+        Retorna uma lista de todos os pontos de coleta ativos.
+        """
+        return COLLECTION_POINT_BASE_QS.filter(is_active=True).order_by('-id')
+
+    def get(self, request):
+        rows = self.get_queryset().values(*COLLECTION_POINT_LIST_FIELDS).iterator(chunk_size=self.chunk_size)
+        return StreamingHttpResponse(self.stream_rows(rows), content_type='application/json')
+
+    def stream_rows(self, rows):
+        """
+        Gera o array JSON bloco a bloco: '[', os pontos separados por vírgula e ']'.
+        """
+        renderer = ORJSONRenderer()
+        separator = b''
+
+        yield b'['
+        while chunk := list(islice(rows, self.chunk_size)):
+            points = serialize_collection_point_rows(chunk, self.request)
+            yield separator + b','.join(renderer.render(point) for point in points)
+            separator = b','
+        yield b']'
+
 @extend_schema(tags=["Ponto de coleta"])
-class InactiveCollectionPointsList(generics.ListAPIView):
+class InactiveCollectionPointsList(CollectionPointFastListMixin, generics.ListAPIView):
     """
     Lista todos os pontos de coleta inativos (is_active=False).
     Esta rota pode ser mais útil para administradores.
     """
     serializer_class = CollectionPointSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = PointCursorPagination
 
     def get_queryset(self):
         """
         Retorna uma lista de todos os pontos de coleta inativos.
         """
-        return CollectionPoint.objects.filter(is_active=False, status='pending').prefetch_related('operating_hours', 'images').select_related('user')
+        return COLLECTION_POINT_BASE_QS.filter(is_active=False, status='pending')
 
     def get_serializer_context(self):
         """
@@ -237,14 +425,43 @@ class InactiveCollectionPointsList(generics.ListAPIView):
 @extend_schema(
     tags=["Ponto de coleta (Admin)"],
     request=PointStatusUpdateSerializer,
-    responses={200: CollectionPointSerializer}
+    responses={
+        200: inline_serializer(
+            name="PointStatusUpdateResponse",
+            fields={
+                "id": serializers.IntegerField(),
+                "is_active": serializers.BooleanField(),
+                "status": serializers.ChoiceField(choices=CollectionPoint._meta.get_field('status').choices)
+            }
+        )
+    }
 )
 class UpdatePointStatusView(generics.UpdateAPIView):
     """
     Endpoint para administradores aprovarem ou rejeitarem um ponto de coleta.
     Atualiza os campos 'is_active' e 'status'.
     """
-    queryset = get_all_object_collection_point()
     serializer_class = PointStatusUpdateSerializer
     permission_classes = [IsAdminUser]
-    lookup_field = 'pk'
\ No newline at end of file
+    lookup_field = 'pk'
+
+    def get_queryset(self):
+        """
+        Retorna todos os pontos de coleta.
+        """
+        return CollectionPoint.objects.all()
+
+    def update(self, request, *args, **kwargs):
+        """
+        Valida o novo status e o grava com um único UPDATE, sem carregar o ponto de coleta.
+        """
+        partial = kwargs.pop('partial', False)
+        serializer = self.get_serializer(data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+
+        pk = self.kwargs[self.lookup_field]
+        updated = self.get_queryset().filter(pk=pk).update(**serializer.validated_data, updated_at=timezone.now())
+        if not updated:
+            raise Http404()
+
+        return Response({'id': int(pk), **serializer.validated_data}, status=status.HTTP_200_OK)
\ No newline at end of file